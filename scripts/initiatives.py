@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Fast command line access to initiatives
+Asks the running server when it is up, otherwise parses the Markdown files
+directly with the same code the server uses (InitiativeHandler).
+
+Usage: ./scripts/initiatives.py [--directory NAME | --path PATH] [--json] list
+       ./scripts/initiatives.py [--directory NAME | --path PATH] [--json] search <QUERY>
+       ./scripts/initiatives.py [--directory NAME | --path PATH] [--json] stats
+"""
+
+import argparse
+import json
+from contextlib import redirect_stdout
+import os
+import sys
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# How long to wait for the local server before reading files directly
+SERVER_TIMEOUT = 0.3
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='List, search and summarize initiatives')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--directory', help='Configured directory name (default: the default directory)')
+    target.add_argument('--path', help='Initiatives directory path')
+    parser.add_argument('--json', action='store_true', help='Print JSON instead of text')
+    parser.add_argument('--offline', action='store_true', help='Do not contact the running server')
+    subcommands = parser.add_subparsers(dest='command', required=True)
+    subcommands.add_parser('list', help='List initiatives')
+    search = subcommands.add_parser('search', help='Full-text search')
+    search.add_argument('query')
+    subcommands.add_parser('stats', help='Counts by status and type')
+    return parser.parse_args(argv)
+
+
+def load_server_module():
+    """Import server.py from the project root, resolving paths like the server does"""
+    os.chdir(ROOT_DIR)
+    sys.path.insert(0, str(ROOT_DIR))
+    # Config warnings printed by the server must not end up in our output
+    with redirect_stdout(sys.stderr):
+        import server
+    return server
+
+
+def resolve_target(config, args):
+    """Return (directory name, path) for the requested directory"""
+    if args.path:
+        path = Path(args.path).expanduser().resolve()
+        for d in config.directories:
+            if d['path'] == path:
+                return d['name'], path
+        return None, path
+
+    if args.directory:
+        directory = config.by_name.get(args.directory)
+        if not directory:
+            raise ValueError(f"Directory '{args.directory}' not found in config.json")
+        return directory['name'], directory['path']
+
+    return None, None
+
+
+def fetch_from_server(config, endpoint, params):
+    """GET an API endpoint from the running server, or None if it is not usable"""
+    host = config.server.get('host', 'localhost')
+    port = config.server.get('port', 3939)
+    if host in ('', '0.0.0.0', '::'):
+        host = 'localhost'
+    query = f"?{urlencode(params)}" if params else ''
+    try:
+        with urlopen(f"http://{host}:{port}{endpoint}{query}", timeout=SERVER_TIMEOUT) as res:
+            return json.loads(res.read().decode())
+    except (HTTPError, URLError, OSError, ValueError):
+        return None
+
+
+class LocalReader:
+    """Runs InitiativeHandler's file parsing without an HTTP request"""
+
+    def __init__(self, server, config, dir_name, path):
+        class Handler(server.InitiativeHandler):
+            def __init__(self):
+                pass
+
+        if path is not None and dir_name is None:
+            # Unconfigured path: read it as the only directory
+            config = server.RuntimeConfig({
+                **config.data,
+                'directories': [{'name': path.name, 'path': str(path), 'default': True}]
+            })
+        self.handler = Handler()
+        self.handler.config = config
+        self.dir_name = dir_name
+
+    def list(self):
+        return self.handler.list_initiatives(self.dir_name)
+
+    def search(self, query):
+        return self.handler.search(query, self.dir_name)
+
+
+def compute_stats(initiatives):
+    stats = {
+        'total': len(initiatives),
+        'byStatus': {},
+        'byType': {},
+        'blockers': 0,
+        'withBlockers': 0
+    }
+    for i in initiatives:
+        status = i.get('status') or 'Unknown'
+        init_type = i.get('type') or 'Unknown'
+        stats['byStatus'][status] = stats['byStatus'].get(status, 0) + 1
+        stats['byType'][init_type] = stats['byType'].get(init_type, 0) + 1
+        stats['blockers'] += i.get('blockers', 0)
+        if i.get('blockers', 0):
+            stats['withBlockers'] += 1
+    return stats
+
+
+def print_text(command, data):
+    if command == 'list':
+        if not data:
+            print("  No initiatives found.")
+        for i in data:
+            if i['name'] and i['name'] != i['id']:
+                print(f"  [{i['id']}] {i['name']}")
+            else:
+                print(f"  [{i['id']}]")
+    elif command == 'search':
+        if not data:
+            print("  No matches found.")
+        for r in data:
+            for m in r['matches']:
+                print(f"  {r['initiative']}/{r['file']}:{m['line_num']}: {m['text']}")
+    elif command == 'stats':
+        print(f"  Total: {data['total']}")
+        print(f"  Blockers: {data['blockers']} (in {data['withBlockers']} initiatives)")
+        print("  By status:")
+        for status, count in sorted(data['byStatus'].items()):
+            print(f"    {status}: {count}")
+        print("  By type:")
+        for init_type, count in sorted(data['byType'].items()):
+            print(f"    {init_type}: {count}")
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.path:
+        # Resolve relative to where the user ran the command, before moving to the project root
+        args.path = str(Path(args.path).expanduser().resolve())
+
+    server = load_server_module()
+    with redirect_stdout(sys.stderr):
+        config = server.CONFIG_STORE.current()
+
+    try:
+        dir_name, path = resolve_target(config, args)
+    except ValueError as e:
+        print(f"✗ Error: {e}", file=sys.stderr)
+        return 1
+
+    data = None
+    # The server only knows configured directories
+    use_server = not args.offline and not (path is not None and dir_name is None)
+    params = {'directory': dir_name} if dir_name else {}
+
+    if args.command == 'search':
+        # The server answers short queries with an empty list without searching
+        if use_server and len(args.query.strip()) >= server.ADMISSION.min_query_length:
+            data = fetch_from_server(config, '/api/search', {'q': args.query, **params})
+        if data is None:
+            data = LocalReader(server, config, dir_name, path).search(args.query)
+    else:
+        if use_server:
+            data = fetch_from_server(config, '/api/initiatives', params)
+        if data is None:
+            data = LocalReader(server, config, dir_name, path).list()
+        if args.command == 'stats':
+            data = compute_stats(data)
+
+    if args.json:
+        print(json.dumps(data, indent=2))
+    else:
+        print_text(args.command, data)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
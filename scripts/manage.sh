@@ -7,6 +7,8 @@
 #        ./manage.sh note <ID> <NOTE>
 #        ./manage.sh comm <ID> <CHANNEL> <LINK> <CONTEXT>
 #        ./manage.sh list
+#        ./manage.sh search <QUERY>
+#        ./manage.sh stats
 
 set -e
 
@@ -19,6 +21,7 @@ CONFIG_FILE="$SCRIPT_DIR/../config.json"
 INITIATIVES_DIR=""
 PID_FILE="$SCRIPT_DIR/../.server.pid"
 SERVER_SCRIPT="$SCRIPT_DIR/../server.py"
+CLI_SCRIPT="$SCRIPT_DIR/initiatives.py"
 
 # Load configuration
 load_config() {
@@ -128,6 +131,14 @@ list_initiatives() {
         return
     fi
 
+    # Prefer the Python CLI (asks the server or parses in one process).
+    # Like the web UI it only lists folders with a README.md and takes the
+    # name from its "# " heading; the shell loop below is the fallback.
+    if python3 "$CLI_SCRIPT" --path "$INITIATIVES_DIR" list 2>/dev/null; then
+        echo ""
+        return
+    fi
+
     for dir in "$INITIATIVES_DIR"/*; do
         if [ -d "$dir" ]; then
             local id=$(basename "$dir")
@@ -148,6 +159,24 @@ list_initiatives() {
     echo ""
 }
 
+# Full-text search in the current directory
+cmd_search() {
+    local query="$1"
+
+    if [ -z "$query" ]; then
+        echo "✗ Error: Missing required arguments"
+        echo "Usage: $0 search <QUERY>"
+        exit 1
+    fi
+
+    python3 "$CLI_SCRIPT" --path "$INITIATIVES_DIR" search "$query"
+}
+
+# Show counts by status and type for the current directory
+cmd_stats() {
+    python3 "$CLI_SCRIPT" --path "$INITIATIVES_DIR" stats
+}
+
 # Show help
 show_help() {
     local dir_count=$(jq '.directories | length' "$CONFIG_FILE")
@@ -166,6 +195,8 @@ USAGE:
     ./manage.sh comm <ID> <CHANNEL> <LINK> <CONTEXT>
                                    Log communication entry
     ./manage.sh list               List all initiatives
+    ./manage.sh search <QUERY>     Full-text search
+    ./manage.sh stats              Counts by status and type
     ./manage.sh start              Start web server
     ./manage.sh stop               Stop web server
     ./manage.sh restart            Restart web server
@@ -181,6 +212,7 @@ EXAMPLES:
   ./manage.sh note ABC-2026-01 "Kickoff meeting scheduled"
   ./manage.sh comm ABC-2026-01 Slack https://slack/... "Risk approval"
   ./manage.sh list
+  ./manage.sh search "risk approval"
   ./manage.sh status
   ./manage.sh stop
 
@@ -798,6 +830,13 @@ elif [ "$1" = "--help" ] || [ "$1" = "-h" ]; then
 elif [ "$1" = "list" ]; then
     list_initiatives
     exit 0
+elif [ "$1" = "search" ]; then
+    shift
+    cmd_search "$@"
+    exit $?
+elif [ "$1" = "stats" ]; then
+    cmd_stats
+    exit $?
 elif [ "$1" = "new" ]; then
     shift
     cmd_new "$@"
@@ -20,22 +20,34 @@ import json
 import mimetypes
 import os
 import re
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import select
+import signal
+import socket
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 
 # Static files directory (React build output)
 STATIC_DIR = Path(__file__).parent / 'src' / 'dist'
 
 
-def load_config():
-    """Load configuration from config.json"""
-    config_path = Path('config.json')
+# Configuration file, relative to the project root the server is started from
+CONFIG_PATH = Path('config.json')
+
 
-    # Default configuration
-    default_config = {
+def default_config():
+    """Configuration used when config.json is missing or unreadable"""
+    return {
         'server': {
             'host': 'localhost',
             'port': 3939
@@ -52,58 +64,399 @@ def load_config():
         ]
     }
 
+
+def read_config_file(config_path=CONFIG_PATH):
+    """Read config.json and merge it with defaults; raises on a missing or invalid file"""
+    defaults = default_config()
+    with open(config_path, 'r') as f:
+        config = json.load(f)
+    # Merge with defaults
+    if 'server' not in config:
+        config['server'] = defaults['server']
+    if 'initiativeTypes' not in config:
+        config['initiativeTypes'] = defaults['initiativeTypes']
+    if 'directories' not in config:
+        config['directories'] = defaults['directories']
+    return config
+
+
+def write_text_atomic(path, content):
+    """Write a file via a temp file and rename, so readers never see it half-written"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}-', dir=str(path.resolve().parent))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        try:
+            mode = path.stat().st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def validate_config(config):
+    """Check the configuration structure; raises ValueError"""
+    if not isinstance(config, dict) or 'server' not in config or 'directories' not in config:
+        raise ValueError('Config must have "server" and "directories" keys')
+    if not isinstance(config['server'], dict):
+        raise ValueError('"server" must be an object')
+    if not isinstance(config['directories'], list) or len(config['directories']) == 0:
+        raise ValueError('At least one directory is required')
+    for d in config['directories']:
+        if not isinstance(d, dict) or not d.get('name') or not d.get('path'):
+            raise ValueError('Each directory must have "name" and "path"')
+        if not isinstance(d['name'], str) or not isinstance(d['path'], str):
+            raise ValueError('Directory "name" and "path" must be strings')
+    workers = config['server'].get('workers', 1)
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError('"server.workers" must be a whole number of at least 1')
+
+
+def load_config(config_path=CONFIG_PATH):
+    """Load configuration from config.json"""
     if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                # Merge with defaults
-                if 'server' not in config:
-                    config['server'] = default_config['server']
-                if 'initiativeTypes' not in config:
-                    config['initiativeTypes'] = default_config['initiativeTypes']
-                if 'directories' not in config:
-                    config['directories'] = default_config['directories']
-                return config
+            config = read_config_file(config_path)
+            validate_config(config)
+            return config
         except Exception as e:
             print(f"Warning: Failed to load config.json: {e}")
             print("Using default configuration")
 
-    return default_config
+    return default_config()
 
 
-# Global configuration
-CONFIG = load_config()
+def config_mtime(config_path=CONFIG_PATH):
+    """Modification time of config.json, or None if it does not exist"""
+    try:
+        return config_path.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
-class InitiativeHandler(BaseHTTPRequestHandler):
-    # Will be set from config
-    DIRECTORIES = []
+class RuntimeConfig:
+    """Immutable snapshot of the configuration with precomputed directory lookups"""
 
-    @classmethod
-    def set_directories(cls, directories):
-        """Set the directories from config"""
-        cls.DIRECTORIES = [
+    def __init__(self, data, version=0, mtime=None):
+        self.data = data
+        self.version = version
+        self.mtime = mtime
+        self.server = data.get('server', {})
+        self.directories = [
             {
                 'name': d['name'],
-                'path': Path(d['path']).resolve(),
+                'path': Path(d['path']).expanduser().resolve(),
                 'default': d.get('default', False)
             }
-            for d in directories
+            for d in data.get('directories', [])
         ]
+        # First entry wins on duplicate names, like the old linear scan
+        self.by_name = {}
+        for d in self.directories:
+            self.by_name.setdefault(d['name'], d)
+        self.default = next((d for d in self.directories if d['default']), None)
+        if self.default is None and self.directories:
+            self.default = self.directories[0]
+        self.default_path = self.default['path'] if self.default else Path('./initiatives').resolve()
+
+    def changed_directories(self, other):
+        """Names of directories added, removed or pointing elsewhere compared to other"""
+        names = set(self.by_name) | set(other.by_name)
+        return sorted(
+            name for name in names
+            if (self.by_name.get(name) or {}).get('path') != (other.by_name.get(name) or {}).get('path')
+        )
+
+
+# PID of the supervising process when running in multi-worker mode
+SUPERVISOR_PID = None
+
+
+class AdmissionController:
+    """Admission control for expensive endpoints
+
+    Combines a token-bucket rate limit per client address, a concurrency
+    limit per route with a bounded wait queue, and a minimum query length /
+    debounce policy for search. Rejections are counted for /api/metrics.
+    """
+
+    DEFAULTS = {
+        'concurrency': {'/api/search': 4, '/api/initiatives': 8},
+        'maxQueue': 32,
+        'queueTimeout': 5.0,
+        'rateLimit': {'rate': 20, 'burst': 40},
+        'search': {'minQueryLength': 2, 'debounceMs': 100}
+    }
+
+    # Forget clients idle for this long once the table gets large
+    CLIENT_IDLE_SECONDS = 60
+    MAX_CLIENTS = 1024
+
+    def __init__(self, settings=None):
+        self.cond = threading.Condition()
+        self.in_flight = {}
+        self.waiting = {}
+        self.buckets = {}  # client -> [tokens, last refill]
+        self.last_search = {}  # client -> time of last search
+        self.admitted = {}
+        self.rejected = {
+            'rate_limited': 0,
+            'queue_full': 0,
+            'queue_timeout': 0,
+            'debounced': 0,
+            'short_query': 0
+        }
+        self.configure(settings)
+
+    @classmethod
+    def parse_settings(cls, settings):
+        """Validate admission settings merged with defaults; raises ValueError"""
+        settings = {} if settings is None else settings
+        defaults = cls.DEFAULTS
+        try:
+            if not isinstance(settings, dict):
+                raise ValueError('must be an object')
+            concurrency = settings.get('concurrency', defaults['concurrency'])
+            if not isinstance(concurrency, dict):
+                raise ValueError('"concurrency" must map routes to limits')
+            rate_limit = {**defaults['rateLimit'], **settings.get('rateLimit', {})}
+            search = {**defaults['search'], **settings.get('search', {})}
+            parsed = {
+                'concurrency': {route: int(limit) for route, limit in concurrency.items()},
+                'maxQueue': int(settings.get('maxQueue', defaults['maxQueue'])),
+                'queueTimeout': float(settings.get('queueTimeout', defaults['queueTimeout'])),
+                'rate': float(rate_limit['rate']),
+                'burst': float(rate_limit['burst']),
+                'minQueryLength': int(search['minQueryLength']),
+                'debounce': float(search['debounceMs']) / 1000
+            }
+        except (TypeError, ValueError) as e:
+            raise ValueError(f'Invalid "admission" settings: {e}')
+
+        if any(limit < 1 for limit in parsed['concurrency'].values()):
+            raise ValueError('Invalid "admission" settings: concurrency limits must be at least 1')
+        if parsed['maxQueue'] < 0 or parsed['queueTimeout'] < 0:
+            raise ValueError('Invalid "admission" settings: maxQueue and queueTimeout cannot be negative')
+        if parsed['rate'] < 0 or (parsed['rate'] > 0 and parsed['burst'] < 1):
+            raise ValueError('Invalid "admission" settings: rateLimit needs rate >= 0 and burst >= 1')
+        if parsed['minQueryLength'] < 0 or parsed['debounce'] < 0:
+            raise ValueError('Invalid "admission" settings: search limits cannot be negative')
+        return parsed
+
+    def configure(self, settings):
+        """Apply admission settings, keeping counters and in-flight state"""
+        try:
+            parsed = self.parse_settings(settings)
+        except ValueError as e:
+            print(f"Warning: {e}")
+            print("Using default admission settings")
+            parsed = self.parse_settings(None)
+        with self.cond:
+            self.concurrency = parsed['concurrency']
+            self.max_queue = parsed['maxQueue']
+            self.queue_timeout = parsed['queueTimeout']
+            self.rate = parsed['rate']
+            self.burst = parsed['burst']
+            self.min_query_length = parsed['minQueryLength']
+            self.debounce = parsed['debounce']
+            self.cond.notify_all()
+
+    def is_limited(self, route):
+        return route in self.concurrency
+
+    def _prune_clients(self, now):
+        if len(self.buckets) > self.MAX_CLIENTS:
+            for client, (_, last) in list(self.buckets.items()):
+                if now - last > self.CLIENT_IDLE_SECONDS:
+                    del self.buckets[client]
+        if len(self.last_search) > self.MAX_CLIENTS:
+            for client, last in list(self.last_search.items()):
+                if now - last > self.CLIENT_IDLE_SECONDS:
+                    del self.last_search[client]
+
+    def take_token(self, client):
+        """Return True if the client is within its rate limit"""
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        with self.cond:
+            self._prune_clients(now)
+            tokens, last = self.buckets.get(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens < 1:
+                self.buckets[client] = (tokens, now)
+                self.rejected['rate_limited'] += 1
+                return False
+            self.buckets[client] = (tokens - 1, now)
+            return True
+
+    def check_search(self, client, query):
+        """Apply the search policy; return a rejection reason or None"""
+        if len(query.strip()) < self.min_query_length:
+            with self.cond:
+                self.rejected['short_query'] += 1
+            return 'short_query'
+        if self.debounce <= 0:
+            return None
+        now = time.monotonic()
+        with self.cond:
+            last = self.last_search.get(client)
+            if last is not None and now - last < self.debounce:
+                self.rejected['debounced'] += 1
+                return 'debounced'
+            # Only admitted searches start a new debounce window
+            self.last_search[client] = now
+        return None
+
+    def acquire(self, route):
+        """Take a concurrency slot for route; return a rejection reason or None"""
+        with self.cond:
+            if self.in_flight.get(route, 0) >= self.concurrency.get(route, 0):
+                if self.waiting.get(route, 0) >= self.max_queue:
+                    self.rejected['queue_full'] += 1
+                    return 'queue_full'
+                self.waiting[route] = self.waiting.get(route, 0) + 1
+                try:
+                    admitted = self.cond.wait_for(
+                        lambda: self.in_flight.get(route, 0) < self.concurrency.get(route, 0),
+                        timeout=self.queue_timeout
+                    )
+                finally:
+                    self.waiting[route] -= 1
+                if not admitted:
+                    self.rejected['queue_timeout'] += 1
+                    return 'queue_timeout'
+            self.in_flight[route] = self.in_flight.get(route, 0) + 1
+            self.admitted[route] = self.admitted.get(route, 0) + 1
+            return None
+
+    def release(self, route):
+        with self.cond:
+            self.in_flight[route] -= 1
+            self.cond.notify_all()
+
+    def metrics(self):
+        with self.cond:
+            return {
+                'pid': os.getpid(),
+                'admitted': dict(self.admitted),
+                'rejected': dict(self.rejected),
+                'inFlight': dict(self.in_flight),
+                'queued': dict(self.waiting),
+                'limits': {
+                    'concurrency': dict(self.concurrency),
+                    'maxQueue': self.max_queue,
+                    'queueTimeout': self.queue_timeout,
+                    'rateLimit': {'rate': self.rate, 'burst': self.burst},
+                    'search': {
+                        'minQueryLength': self.min_query_length,
+                        'debounceMs': int(self.debounce * 1000)
+                    }
+                }
+            }
+
+
+class ConfigStore:
+    """Holds the current RuntimeConfig and reloads it when config.json changes
+
+    Requests read the snapshot once and use it throughout; updates build a
+    new snapshot and swap it in, so readers never see a half-applied config.
+    """
+
+    def __init__(self, config_path=CONFIG_PATH):
+        self.config_path = config_path
+        self.lock = threading.Lock()
+        self.checked_mtime = config_mtime(config_path)
+        try:
+            self.snapshot = RuntimeConfig(load_config(config_path), 1, self.checked_mtime)
+        except Exception as e:
+            print(f"Warning: Failed to load config.json: {e}")
+            print("Using default configuration")
+            self.snapshot = RuntimeConfig(default_config(), 1, self.checked_mtime)
+        ADMISSION.configure(self.snapshot.server.get('admission'))
+
+    def current(self):
+        """Return the current snapshot, reloading config.json if it was edited externally"""
+        if config_mtime(self.config_path) != self.checked_mtime:
+            self.reload()
+        return self.snapshot
+
+    def reload(self):
+        """Re-read config.json; keep the current snapshot if the file is missing or invalid"""
+        with self.lock:
+            mtime = config_mtime(self.config_path)
+            if mtime == self.checked_mtime:
+                return self.snapshot
+            self.checked_mtime = mtime
+            if mtime is None:
+                return self.snapshot
+            try:
+                data = read_config_file(self.config_path)
+                validate_config(data)
+                new = RuntimeConfig(data, self.snapshot.version + 1, mtime)
+            except Exception as e:
+                print(f"Warning: Failed to reload config.json, keeping previous configuration: {e}")
+                return self.snapshot
+            changed = self._swap(new)
+        if changed:
+            print(f"Config reloaded. Directories changed: {changed}")
+        return self.snapshot
+
+    def save(self, data):
+        """Write config.json and swap in the new configuration; returns changed directory names"""
+        with self.lock:
+            # Build and check everything first so a bad config never reaches disk
+            validate_config(data)
+            AdmissionController.parse_settings(data['server'].get('admission'))
+            new = RuntimeConfig(data, self.snapshot.version + 1)
+            # Other workers re-read config.json when its mtime changes
+            write_text_atomic(self.config_path, json.dumps(data, indent=2) + '\n')
+            new.mtime = self.checked_mtime = config_mtime(self.config_path)
+            return self._swap(new)
+
+    def _swap(self, new):
+        old = self.snapshot
+        ADMISSION.configure(new.server.get('admission'))
+        self.snapshot = new
+        return new.changed_directories(old)
+
+
+ADMISSION = AdmissionController()
+CONFIG_STORE = ConfigStore()
+
+
+def reload_config():
+    """Re-read config.json and apply it to this process"""
+    CONFIG_STORE.reload()
+
+
+def notify_config_changed():
+    """Ask the supervisor to make every worker reload config.json"""
+    if SUPERVISOR_PID is not None:
+        try:
+            os.kill(SUPERVISOR_PID, signal.SIGHUP)
+        except OSError as e:
+            print(f"Warning: Failed to notify supervisor of config change: {e}")
+
+
+class InitiativeHandler(BaseHTTPRequestHandler):
+    # Configuration snapshot for the current request, taken in do_GET/do_POST
+    config = None
+
+    # Serializes read-then-append in add_note across request threads
+    notes_lock = threading.Lock()
 
     def get_default_directory(self):
         """Get the default directory"""
-        for d in self.DIRECTORIES:
-            if d['default']:
-                return d
-        return self.DIRECTORIES[0] if self.DIRECTORIES else None
+        return self.config.default
 
     def get_directory_by_name(self, name):
         """Get directory by name"""
-        for d in self.DIRECTORIES:
-            if d['name'] == name:
-                return d
-        return None
+        return self.config.by_name.get(name)
 
     def get_initiatives_dir(self, dir_name=None):
         """Get the initiatives directory path"""
@@ -112,8 +465,7 @@ class InitiativeHandler(BaseHTTPRequestHandler):
             if directory:
                 return directory['path']
 
-        default_dir = self.get_default_directory()
-        return default_dir['path'] if default_dir else Path('./initiatives')
+        return self.config.default_path
 
     def log_message(self, format, *args):
         """Override to provide cleaner logging"""
@@ -127,6 +479,16 @@ class InitiativeHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(json.dumps(data).encode())
 
+    def send_rejection(self, reason):
+        """Reply to a request turned away by admission control"""
+        status = 503 if reason in ('queue_full', 'queue_timeout') else 429
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(json.dumps({'error': 'Too many requests', 'reason': reason}).encode())
+
     def send_file(self, filepath, content_type):
         """Helper to send file contents"""
         try:
@@ -172,23 +534,52 @@ class InitiativeHandler(BaseHTTPRequestHandler):
         self.end_headers()
 
     def do_GET(self):
-        """Handle GET requests"""
+        """Handle GET requests, applying admission control to expensive routes"""
+        self.config = CONFIG_STORE.current()
         parsed = urlparse(self.path)
         path = parsed.path
 
+        if not ADMISSION.is_limited(path):
+            self.dispatch_get(parsed)
+            return
+
+        client = self.client_address[0]
+        if not ADMISSION.take_token(client):
+            self.send_rejection('rate_limited')
+            return
+
+        if path == '/api/search':
+            query = parse_qs(parsed.query).get('q', [''])[0]
+            reason = ADMISSION.check_search(client, query)
+            if reason == 'short_query':
+                self.send_json([])
+                return
+            if reason:
+                self.send_rejection(reason)
+                return
+
+        reason = ADMISSION.acquire(path)
+        if reason:
+            self.send_rejection(reason)
+            return
+        try:
+            self.dispatch_get(parsed)
+        finally:
+            ADMISSION.release(path)
+
+    def dispatch_get(self, parsed):
+        """Route a GET request to the API or static files"""
+        path = parsed.path
+
+        # API: Admission control metrics
+        if path == '/api/metrics':
+            self.send_json({**ADMISSION.metrics(), 'configVersion': self.config.version})
+            return
+
         # API: Get full config
         if path == '/api/config':
             try:
-                config_path = Path('config.json')
-                if config_path.exists():
-                    with open(config_path, 'r') as f:
-                        config = json.load(f)
-                else:
-                    config = {
-                        'server': {'host': 'localhost', 'port': 3939},
-                        'directories': [{'name': 'Personal', 'path': './initiatives', 'default': True}]
-                    }
-                self.send_json(config)
+                self.send_json(self.config.data)
             except Exception as e:
                 self.send_json({'error': str(e)}, 500)
             return
@@ -202,7 +593,7 @@ class InitiativeHandler(BaseHTTPRequestHandler):
                         'path': str(d['path']),
                         'default': d['default']
                     }
-                    for d in self.DIRECTORIES
+                    for d in self.config.directories
                 ]
                 self.send_json(dirs)
             except Exception as e:
@@ -249,6 +640,7 @@ class InitiativeHandler(BaseHTTPRequestHandler):
 
     def do_POST(self):
         """Handle POST requests"""
+        self.config = CONFIG_STORE.current()
         content_length = int(self.headers.get('Content-Length', 0))
         body = json.loads(self.rfile.read(content_length).decode())
 
@@ -259,27 +651,17 @@ class InitiativeHandler(BaseHTTPRequestHandler):
         try:
             # Update config
             if path == '/api/config':
-                config_path = Path('config.json')
-                # Validate structure
-                if 'server' not in body or 'directories' not in body:
-                    raise ValueError('Config must have "server" and "directories" keys')
-                if not isinstance(body['directories'], list) or len(body['directories']) == 0:
-                    raise ValueError('At least one directory is required')
-                for d in body['directories']:
-                    if not d.get('name') or not d.get('path'):
-                        raise ValueError('Each directory must have "name" and "path"')
+                # Validate structure (ConfigStore.save validates the rest)
+                validate_config(body)
                 # Ensure exactly one default
                 has_default = any(d.get('default') for d in body['directories'])
                 if not has_default:
                     body['directories'][0]['default'] = True
-                with open(config_path, 'w') as f:
-                    json.dump(body, f, indent=2)
-                    f.write('\n')
-                # Hot-reload directories in memory
-                self.set_directories(body['directories'])
-                global CONFIG
-                CONFIG = body
-                print(f"Config updated. Directories reloaded: {[d['name'] for d in body['directories']]}")
+                # Write and hot-swap the in-memory configuration
+                changed = CONFIG_STORE.save(body)
+                self.config = CONFIG_STORE.current()
+                print(f"Config updated (version {self.config.version}). Directories changed: {changed}")
+                notify_config_changed()
                 self.send_json({'success': True})
                 return
 
@@ -472,7 +854,7 @@ class InitiativeHandler(BaseHTTPRequestHandler):
         # No directory specified: search across all directories
         results = []
         seen = set()
-        for d in self.DIRECTORIES:
+        for d in self.config.directories:
             for r in self._search_directory(d['path'], query_lower):
                 key = (r['initiative'], r['file'])
                 if key not in seen:
@@ -508,7 +890,7 @@ class InitiativeHandler(BaseHTTPRequestHandler):
 
 ## Overview
 - **Initiative ID:** {init_id}
-- **Type:** {init_type or '<!-- ' + ' | '.join(CONFIG.get('initiativeTypes', [])) + ' -->'}
+- **Type:** {init_type or '<!-- ' + ' | '.join(self.config.data.get('initiativeTypes', [])) + ' -->'}
 - **Status:** Idea
 - **Start date:**
 - **Target deadline:**
@@ -627,16 +1009,21 @@ class InitiativeHandler(BaseHTTPRequestHandler):
             raise FileNotFoundError(f'Initiative {init_id} not found')
 
         today = datetime.now().strftime('%Y-%m-%d')
-        content = notes_file.read_text()
 
-        # Check if today's header exists
-        if f"## {today}" in content:
-            # Append to today's section
-            with open(notes_file, 'a') as f:
+        # Hold the lock between checking for today's header and appending,
+        # so concurrent requests (threads or workers) don't both add it
+        with self.notes_lock, open(notes_file, 'a+') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            content = f.read()
+
+            # Check if today's header exists
+            if f"## {today}" in content:
+                # Append to today's section
                 f.write(f"- {note}\n")
-        else:
-            # Create new date section
-            with open(notes_file, 'a') as f:
+            else:
+                # Create new date section
                 f.write(f"\n## {today}\n- {note}\n")
 
         return {'success': True}
@@ -699,36 +1086,207 @@ class InitiativeHandler(BaseHTTPRequestHandler):
         if not file_path.exists():
             raise FileNotFoundError(f'File {actual_filename} not found in initiative {init_id}')
 
-        file_path.write_text(content)
+        # Concurrent list/search requests must never see a truncated file
+        write_text_atomic(file_path, content)
 
         return {'success': True}
 
 
+# Workers report liveness to the supervisor this often (seconds); a worker
+# silent for HEARTBEAT_TIMEOUT is considered hung and replaced
+HEARTBEAT_INTERVAL = 1
+HEARTBEAT_TIMEOUT = 10
+
+
+class InitiativeServer(ThreadingHTTPServer):
+    """Threaded HTTP server that can share its port with sibling workers"""
+    daemon_threads = True
+
+    def __init__(self, server_address, handler_class, reuse_port=False, heartbeat_fd=None):
+        self.reuse_port = reuse_port
+        self.heartbeat_fd = heartbeat_fd
+        self.last_heartbeat = 0
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def service_actions(self):
+        """Exit if the supervisor went away so orphaned workers don't hold the port"""
+        if SUPERVISOR_PID is not None and os.getppid() != SUPERVISOR_PID:
+            os._exit(0)
+        # Runs from the serve_forever loop, so a stuck loop stops the heartbeat
+        if self.heartbeat_fd is not None:
+            now = time.monotonic()
+            if now - self.last_heartbeat >= HEARTBEAT_INTERVAL:
+                self.last_heartbeat = now
+                try:
+                    os.write(self.heartbeat_fd, b'.')
+                except BlockingIOError:
+                    pass
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def run_worker(host, port, heartbeat_fd):
+    """Worker process body: serve requests until terminated"""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGHUP, lambda signum, frame: reload_config())
+    os.set_blocking(heartbeat_fd, False)
+
+    server = InitiativeServer((host, port), InitiativeHandler, reuse_port=True, heartbeat_fd=heartbeat_fd)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def run_workers(host, port, workers):
+    """Pre-fork workers sharing the port via SO_REUSEPORT; replace any that die or hang"""
+    global SUPERVISOR_PID
+    SUPERVISOR_PID = os.getpid()
+
+    # Fail fast if the port is taken, including by another tracker using SO_REUSEPORT
+    probe = InitiativeServer((host, port), InitiativeHandler)
+    probe.server_close()
+
+    children = {}  # pid -> {'started', 'beat', 'fd'}
+
+    def spawn():
+        heartbeat_r, heartbeat_w = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            os.close(heartbeat_r)
+            for child in children.values():
+                os.close(child['fd'])
+            code = 0
+            try:
+                run_worker(host, port, heartbeat_w)
+            except Exception as e:
+                print(f"✗ Worker {os.getpid()} failed: {e}")
+                code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+        os.close(heartbeat_w)
+        now = time.monotonic()
+        children[pid] = {'started': now, 'beat': now, 'fd': heartbeat_r}
+
+    def forward_reload(signum, frame):
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGHUP)
+            except OSError:
+                pass
+
+    signal.signal(signal.SIGHUP, forward_reload)
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+
+    for _ in range(workers):
+        spawn()
+
+    try:
+        while True:
+            fds = {child['fd']: pid for pid, child in children.items()}
+            readable, _, _ = select.select(list(fds), [], [], HEARTBEAT_INTERVAL)
+            now = time.monotonic()
+            for fd in readable:
+                # An empty read means the worker closed its end (it exited)
+                if os.read(fd, 1024):
+                    children[fds[fd]]['beat'] = now
+
+            for pid, child in children.items():
+                if now - child['beat'] > HEARTBEAT_TIMEOUT:
+                    print(f"⚠ Worker {pid} stopped responding, killing it")
+                    child['beat'] = now
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except OSError:
+                        pass
+
+            while True:
+                try:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    break
+                if pid == 0:
+                    break
+                child = children.pop(pid, None)
+                if child is None:
+                    continue
+                os.close(child['fd'])
+                print(f"⚠ Worker {pid} exited (status {status}), restarting")
+                # Back off when a worker dies right after starting to avoid a crash loop
+                if time.monotonic() - child['started'] < 1:
+                    time.sleep(1)
+                spawn()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        for pid in list(children):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+
+
 def main():
     """Start the server"""
-    host = CONFIG['server'].get('host', 'localhost')
-    port = CONFIG['server'].get('port', 3939)
+    config = CONFIG_STORE.current()
+    host = config.server.get('host', 'localhost')
+    port = config.server.get('port', 3939)
+    workers = config.server.get('workers', 1)
+
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        print(f"Warning: Invalid server.workers value {workers!r}, using 1 worker")
+        workers = 1
 
-    # Set directories on the handler class
-    InitiativeHandler.set_directories(CONFIG['directories'])
+    # Only Linux spreads connections across SO_REUSEPORT sockets; elsewhere
+    # (macOS/BSD) one socket would receive them all
+    if workers > 1 and not (sys.platform.startswith('linux') and hasattr(socket, 'SO_REUSEPORT')):
+        print("Warning: Multiple workers require Linux SO_REUSEPORT load balancing, falling back to 1 worker")
+        workers = 1
 
-    server = HTTPServer((host, port), InitiativeHandler)
+    if workers == 1:
+        server = InitiativeServer((host, port), InitiativeHandler)
 
     print("=" * 60)
     print("  Personal Initiative Tracker - Web UI")
     print("=" * 60)
     print(f"\n✓ Server running at http://{host}:{port}")
+    if workers > 1:
+        print(f"✓ Running {workers} worker processes")
     if STATIC_DIR.exists():
         print(f"✓ Serving React app from {STATIC_DIR}")
     else:
         print(f"⚠ React build not found at {STATIC_DIR}")
         print(f"  Run: cd src && npm run build")
     print(f"✓ Directories configured:")
-    for d in CONFIG['directories']:
+    for d in config.data['directories']:
         marker = " (default)" if d.get('default') else ""
         print(f"  - {d['name']}: {d['path']}{marker}")
     print("✓ Press Ctrl+C to stop\n")
 
+    if workers > 1:
+        run_workers(host, port, workers)
+        print("\n\n✓ Server stopped")
+        return
+
     try:
         server.serve_forever()
     except KeyboardInterrupt: